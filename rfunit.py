@@ -3,14 +3,42 @@ Xbox One I2C RF Unit
 """
 
 try:
-    from typing import List, Generator
+    from typing import List, Tuple, Sequence, Generator
 except:
     pass
+try:
+    import micropython
+except ImportError:
+    # CPython: run @micropython.native functions as regular bytecode
+    class micropython:
+        @staticmethod
+        def native(func):
+            return func
 import sys
+import time
 import struct
 
 I2C_ADDR = 0x5A
 FLASH_SIZE = 0x24400 # 145KB
+# Known flash payload size of a single CMD_FLASH_READ_xC3 reply
+FLASH_CHUNK_SIZE = 6
+# The ISD9160 on the RF Unit handles I2C Fast-mode
+I2C_FREQ = 400000
+# Standard-mode, used if the RF Unit is not detected at I2C_FREQ
+I2C_FREQ_FALLBACK = 100000
+# Dump file is written in blocks of this size
+DUMP_BLOCK_SIZE = 0x1000
+# File buffer for dump.bin, whole dump fits so the host flushes once
+# (ignored by Micropython)
+DUMP_FILE_BUFFERING = 1 << 20
+
+try:
+    # Precompiled U32-LE address format, packs without re-parsing "<I" each call
+    _pack_addr_into = struct.Struct("<I").pack_into
+except AttributeError:
+    # Micropython's struct has no Struct class
+    def _pack_addr_into(buf, offset: int, addr: int) -> None:
+        struct.pack_into("<I", buf, offset, addr)
 
 class I2CClient:
     """
@@ -19,15 +47,23 @@ class I2CClient:
     def scan(self) -> List[int]:
         raise NotImplementedError()
 
-    def read(self, read_len: int) -> List[int]:
+    def read(self, read_len: int) -> bytes:
         raise NotImplementedError()
 
-    def write(self, data: List[int]) -> None:
+    def write(self, data: bytes) -> None:
         raise NotImplementedError()
 
-    def transmit(self, data: List[int], read_len: int) -> List[int]:
+    def transmit(self, data: bytes, read_len: int) -> bytes:
         raise NotImplementedError()
 
+    def transmit_batch(self, frames: List[bytes], read_len: int) -> List[bytes]:
+        """
+        Issue one write-then-read transaction per frame, back-to-back.
+        Clients that can queue several transactions per bus call may override this.
+        """
+        transmit = self.transmit
+        return [transmit(frame, read_len) for frame in frames]
+
 
 class GreatFetDevice(I2CClient):
     def __init__(self):
@@ -42,21 +78,24 @@ class GreatFetDevice(I2CClient):
     def scan(self) -> List[int]:
         return self.bus.scan()
 
-    def read(self, read_len: int) -> List[int]:
-        return self.dev.read(read_len)
+    def read(self, read_len: int) -> bytes:
+        return bytes(self.dev.read(read_len))
 
-    def write(self, data: List[int]) -> None:
-        self.dev.write(data)
+    def write(self, data: bytes) -> None:
+        self.dev.write(list(data))
 
-    def transmit(self, data: List[int], read_len: int) -> List[int]:
-        return self.dev.transmit(data, read_len)
+    def transmit(self, data: bytes, read_len: int) -> bytes:
+        return bytes(self.dev.transmit(list(data), read_len))
 
 
 class RPiDevice(I2CClient):
     def __init__(self, bus_id: int = 1):
         # Use I2C1 by default, I2C0 is reserved for HAT EEPROM
-        from smbus2 import SMBus
+        from smbus2 import SMBus, I2cFunc, i2c_msg
         self.bus = SMBus(bus_id)
+        self.i2c_msg = i2c_msg
+        # Adapters without plain I2C support (no I2C_RDWR ioctl) fall back to byte access
+        self.use_rdwr = (self.bus.funcs & I2cFunc.I2C) != 0
 
     def scan(self) -> List[int]:
         # smbus2 does not support scanning
@@ -65,19 +104,41 @@ class RPiDevice(I2CClient):
         # Returning the expected result here anyway
         return [I2C_ADDR]
 
-    def read(self, read_len: int) -> List[int]:
-        resp = []
-        for _ in range(0, read_len):
-            resp.append(self.bus.read_byte(I2C_ADDR))
-        return resp
-
-    def write(self, data: List[int]) -> None:
-        for b in data:
-            self.bus.write_byte(I2C_ADDR, b)
-
-    def transmit(self, data: List[int], read_len: int) -> List[int]:
-        self.write(data)
-        return self.read(read_len)
+    def read(self, read_len: int) -> bytes:
+        if not self.use_rdwr:
+            resp = bytearray(read_len)
+            read_byte = self.bus.read_byte
+            for i in range(read_len):
+                resp[i] = read_byte(I2C_ADDR)
+            return resp
+        # Single I2C transaction instead of one START/STOP per byte
+        msg = self.i2c_msg.read(I2C_ADDR, read_len)
+        self.bus.i2c_rdwr(msg)
+        return bytes(msg)
+
+    def write(self, data: bytes) -> None:
+        """
+        Sends data as a single I2C write, so multi-byte commands like
+        play_sound ([0x81, num]) or reset ([0x4A, 0x55]) share one START/STOP.
+        Only the byte-wise fallback splits them.
+        """
+        if not self.use_rdwr:
+            write_byte = self.bus.write_byte
+            for b in data:
+                write_byte(I2C_ADDR, b)
+            return
+        self.bus.i2c_rdwr(self.i2c_msg.write(I2C_ADDR, data))
+
+    def transmit(self, data: bytes, read_len: int) -> bytes:
+        if not self.use_rdwr:
+            self.write(data)
+            return self.read(read_len)
+        # Write, repeated START, read - no STOP in between
+        i2c_msg = self.i2c_msg
+        write_msg = i2c_msg.write(I2C_ADDR, data)
+        read_msg = i2c_msg.read(I2C_ADDR, read_len)
+        self.bus.i2c_rdwr(write_msg, read_msg)
+        return bytes(read_msg)
 
 
 class MicropythonDevice(I2CClient):
@@ -87,15 +148,17 @@ class MicropythonDevice(I2CClient):
     def scan(self) -> List[int]:
         return self.dev.scan()
 
-    def read(self, read_len: int) -> List[int]:
-        return list(self.dev.readfrom(I2C_ADDR, read_len))
+    def read(self, read_len: int) -> bytes:
+        return self.dev.readfrom(I2C_ADDR, read_len)
 
-    def write(self, data: List[int]) -> None:
-        self.dev.writeto(I2C_ADDR, bytes(data))
+    def write(self, data: bytes) -> None:
+        self.dev.writeto(I2C_ADDR, data)
 
-    def transmit(self, data: List[int], read_len: int) -> List[int]:
-        self.write(data)
-        return self.read(read_len)
+    def transmit(self, data: bytes, read_len: int) -> bytes:
+        # Call the machine.I2C methods directly, skips two wrapper calls per transaction
+        dev = self.dev
+        dev.writeto(I2C_ADDR, data)
+        return dev.readfrom(I2C_ADDR, read_len)
 
 
 class DummyDevice(I2CClient):
@@ -105,16 +168,18 @@ class DummyDevice(I2CClient):
     def scan(self) -> bool:
         return [I2C_ADDR]
 
-    def read(self, read_len: int) -> List[int]:
+    def read(self, read_len: int) -> bytes:
         print(f"read ({read_len=})")
-        return list(b"\x00" * read_len)
+        return bytes(read_len)
 
-    def write(self, data: List[int]) -> None:
+    def write(self, data: bytes) -> None:
+        data = bytes(data)
         print(f"write ({data=})")
 
-    def transmit(self, data: List[int], read_len: int) -> List[int]:
+    def transmit(self, data: bytes, read_len: int) -> bytes:
+        data = bytes(data)
         print(f"transmit ({data=}, {read_len=})")
-        return list(b"\x00" * read_len)
+        return bytes(read_len)
 
 """
 Commands
@@ -129,6 +194,17 @@ CMD_START_x81 = 0x81
 CMD_STOP_x02 = 0x02
 CMD_RESET_x4A = 0x4A
 
+# Fixed command frames, built once
+_FRAME_INTERRUPT_READ = bytes([CMD_INTERRUPT_READ_xC0])
+_FRAME_STOP = bytes([CMD_STOP_x02])
+_FRAME_RESET = bytes([CMD_RESET_x4A, 0x55])
+
+# Expected reply of a flash read cmd at addr 0, used by bruteforce_cmd
+# POSSIBLE_DATA = b"ISD9160"
+# POSSIBLE_DATA = b"9160"
+# POSSIBLE_DATA = b"Nuvoton"
+# Reference: https://github.com/robbie-cao/piccolo/blob/cd7f55475db9e19090656238a3268f0576cc6651/SDK/CMSIS/CM0/DeviceSupport/Nuvoton/ISD91xx/boot_ISD9xx.c#L195
+POSSIBLE_DATA = b"\x00\x30\x00\x20"
 
 """
 Registers
@@ -178,125 +254,382 @@ class Sound:
 class RfUnitI2C:
     def __init__(self, dev: I2CClient):
         self.dev = dev
+        # Bound once, saves the lookup through self.dev on every I2C call
+        self._transmit = dev.transmit
+        self._transmit_batch = dev.transmit_batch
+        self._write = dev.write
+        # Reusable read_data frame, only the address is rewritten per call
+        self._flash_cmd = bytearray(5)
+        self._flash_cmd[0] = CMD_FLASH_READ_xC3
 
     def detect(self) -> bool:
         ids = self.dev.scan()
         print("Discovered devices: ", ids)
         return I2C_ADDR in ids
 
-    def _read_interrupt(self) -> List[int]:
-        return self.dev.transmit([CMD_INTERRUPT_READ_xC0], 2)
+    def _read_interrupt(self) -> bytes:
+        return self._transmit(_FRAME_INTERRUPT_READ, 2)
 
-    def read_register(self, register: int) -> List[int]:
-        return self.dev.transmit([CMD_REG_READ_xC1, register], 4)
+    def read_register(self, register: int) -> bytes:
+        return self._transmit(bytes([CMD_REG_READ_xC1, register]), 4)
 
     def _write_register(self, register: int, data: List[int]):
-        write_data = [CMD_REG_WRITE_x48]
-        write_data.append(register)
-        write_data.extend(data)
-
-        self.dev.write(write_data)
+        self._write(bytes([CMD_REG_WRITE_x48, register]) + bytes(data))
 
     def init(self):
         self._write_register(REG_STATUS, [0x01])
         self._write_register(REG_ADDR0, [0xFF, 0xFF])
 
     def stop(self):
-        self.dev.write([CMD_STOP_x02])
-
-    def read_data(self, addr: int) -> bytes:
-        cmd_bytes = [CMD_FLASH_READ_xC3]
-        # Convert address to bytes, U32-LE and append to cmd buffer
-        cmd_bytes.extend(list(struct.pack("<I", addr)))
-        # Send command and receive data (we get 9 bytes back)
-        data = bytes(self.dev.transmit(cmd_bytes, 8))
-        # Cut ?status? bytes (discard first 2 bytes and cut off after 8th), yielding 6 bytes
+        self._write(_FRAME_STOP)
+
+    def read_data(self, addr: int, length: int = FLASH_CHUNK_SIZE) -> bytes:
+        # Address is appended to the cmd as U32-LE
+        _pack_addr_into(self._flash_cmd, 1, addr)
+        # Send command and receive data (we get 9 bytes back for length 6)
+        data = self._transmit(self._flash_cmd, length + 2)
+        # Cut ?status? bytes (discard first 2 bytes and cut off after length), yielding length bytes
         # GreatFET, when asked to receive 8 bytes, returns 9
-        return data[2:8]
+        return data[2:2 + length]
+
+    def probe_read_length(self, lengths: Tuple[int, ...] = (128, 64, 32, 16)) -> int:
+        """
+        Find the largest read length for which a single CMD_FLASH_READ_xC3
+        reply matches the same range read in FLASH_CHUNK_SIZE chunks.
+        Lengths failing on the bus are skipped. Falls back to FLASH_CHUNK_SIZE.
+        """
+        for length in lengths:
+            try:
+                expected = b"".join(
+                    self.read_data(addr) for addr in range(0, length, FLASH_CHUNK_SIZE)
+                )[:length]
+                if self.read_data(0, length) == expected:
+                    return length
+            except OSError as e:
+                print("Read length", length, "failed:", e)
+        return FLASH_CHUNK_SIZE
+
+    @micropython.native
+    def read_data_batch(self, addrs: Sequence[int], length: int = FLASH_CHUNK_SIZE) -> bytearray:
+        # One buffer for all frames of the batch, each frame is a 5 byte view into it
+        buf = bytearray(5 * len(addrs))
+        mv = memoryview(buf)
+        pack_into = _pack_addr_into
+        frames = []
+        append = frames.append
+        pos = 0
+        for addr in addrs:
+            buf[pos] = CMD_FLASH_READ_xC3
+            pack_into(buf, pos + 1, addr)
+            append(mv[pos:pos + 5])
+            pos += 5
+        # Same framing as read_data, length payload bytes per address.
+        # Payloads are copied once, straight from the replies into the result
+        end = 2 + length
+        out = bytearray(length * len(frames))
+        out_mv = memoryview(out)
+        pos = 0
+        for data in self._transmit_batch(frames, end):
+            out_mv[pos:pos + length] = memoryview(data)[2:end]
+            pos += length
+        return out
 
     def play_sound(self, num: int):
-        self.dev.write([CMD_START_x81, num])
+        self._write(bytes([CMD_START_x81, num]))
 
     def reset(self):
-        self.dev.write([CMD_RESET_x4A, 0x55])
-
-    def dump_flash(self, print_addrs: bool = False) -> Generator[bytes]:
-        CHUNK_SIZE = 6
-        # Read data in chunks
-        for addr in range(0, FLASH_SIZE, CHUNK_SIZE):
-            if print_addrs and (addr % (CHUNK_SIZE * 200)) == 0:
-                print("* 0x{:04X}", addr)
-            res = self.read_data(addr)
-            yield res
-
-    def bruteforce_cmd(self) -> int | None:
-        # POSSIBLE_DATA = b"ISD9160"
-        # POSSIBLE_DATA = b"9160"
-        # POSSIBLE_DATA = b"Nuvoton"
-        # Reference: https://github.com/robbie-cao/piccolo/blob/cd7f55475db9e19090656238a3268f0576cc6651/SDK/CMSIS/CM0/DeviceSupport/Nuvoton/ISD91xx/boot_ISD9xx.c#L195
-        POSSIBLE_DATA = b"\x00\x30\x00\x20"
-
-        # Create list of all possible commands
-        cmds_to_test = list(range(0, 0xFF))
-
-        # Remove known cmds
-        for known_cmd in [
+        self._write(_FRAME_RESET)
+
+    @micropython.native
+    def dump_flash(self, print_addrs: bool = False, chunk_size: int = FLASH_CHUNK_SIZE, start: int = 0, end: int = FLASH_SIZE) -> Generator[bytearray, None, None]:
+        # Every batch is yielded as a freshly allocated bytearray, not shared between yields
+        CHUNK_SIZE = chunk_size
+        # Addresses per batch, keeps batches around 384 bytes for any chunk size
+        BATCH_SIZE = max(1, 384 // CHUNK_SIZE)
+        BATCH_BYTES = CHUNK_SIZE * BATCH_SIZE
+        # Bind hot lookups once, not per batch
+        read_data_batch = self.read_data_batch
+        FULL_BATCHES_END = end - ((end - start) % BATCH_BYTES)
+        # Print progress every PRINT_INTERVAL batches, counted instead of addr modulo
+        PRINT_INTERVAL = 3
+        tick = 0
+        # Read data in batches of chunks, yielding 384 bytes at a time
+        for addr in range(start, FULL_BATCHES_END, BATCH_BYTES):
+            if print_addrs:
+                if tick == 0:
+                    print("* 0x{:04X}".format(addr))
+                    tick = PRINT_INTERVAL
+                tick -= 1
+            yield read_data_batch(range(addr, addr + BATCH_BYTES, CHUNK_SIZE), CHUNK_SIZE)
+        # Remaining partial batch, end is not necessarily a multiple of CHUNK_SIZE
+        # (FLASH_SIZE is not), so cut off what the last chunk read past end
+        tail = end - FULL_BATCHES_END
+        if tail:
+            yield read_data_batch(range(FULL_BATCHES_END, end, CHUNK_SIZE), CHUNK_SIZE)[:tail]
+
+    def dump_flash_to(self, f, print_addrs: bool = False, chunk_size: int = FLASH_CHUNK_SIZE) -> None:
+        # Collect chunks into a reusable block, flash FS writes are expensive
+        writer = BlockWriter(f)
+        feed = writer.feed
+        for chunk in self.dump_flash(print_addrs, chunk_size):
+            feed(chunk)
+        writer.flush()
+
+    def dump_flash_parallel(self, devices: List[I2CClient], chunk_size: int = FLASH_CHUNK_SIZE) -> bytes:
+        """
+        Opt-in: split the dump across this client plus additional clients on
+        other buses wired to the same RF Unit, one worker thread per bus.
+        Only valid if the RF Unit handles concurrent access on its bus interfaces.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        units = [self] + [RfUnitI2C(dev) for dev in devices]
+        # Ranges are aligned to chunk_size so every worker reads whole chunks
+        chunks_per_unit = -(-FLASH_SIZE // chunk_size // len(units))
+        seg_size = max(1, chunks_per_unit) * chunk_size
+        ranges = [(start, min(start + seg_size, FLASH_SIZE)) for start in range(0, FLASH_SIZE, seg_size)]
+
+        def read_range(unit, start, end):
+            return b"".join(unit.dump_flash(False, chunk_size, start, end))
+
+        with ThreadPoolExecutor(max_workers=len(units)) as executor:
+            segments = [
+                executor.submit(read_range, unit, start, end)
+                for unit, (start, end) in zip(units, ranges)
+            ]
+            # Merge in address order
+            return b"".join(segment.result() for segment in segments)
+
+    async def dump_flash_async(self, consumer, print_addrs: bool = False, chunk_size: int = FLASH_CHUNK_SIZE, depth: int = 4) -> None:
+        """
+        Host-side variant of dump_flash, passes each chunk to consumer.
+        Up to depth batches are prefetched on a single worker thread, bus access
+        stays serialized while consumer handles the previous chunk.
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+
+        import asyncio
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        chunks = self.dump_flash(print_addrs, chunk_size)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = deque()
+            for _ in range(depth):
+                pending.append(loop.run_in_executor(executor, next, chunks, None))
+            while True:
+                chunk = await pending.popleft()
+                if chunk is None:
+                    break
+                pending.append(loop.run_in_executor(executor, next, chunks, None))
+                consumer(chunk)
+
+    def _bruteforce_cmds(self) -> List[int]:
+        known_cmds = {
             CMD_RESET_x4A,
             CMD_REG_WRITE_x48,
             CMD_INTERRUPT_READ_xC0,
             CMD_REG_READ_xC1,
+            CMD_FLASH_READ_xC3,
             CMD_START_x81,
             CMD_STOP_x02
-        ]:
-            cmds_to_test.remove(known_cmd)
+        }
+        # Known cmds cluster in families by upper nibble (0x4x, 0x8x, 0xCx),
+        # so probe their neighborhoods first, most read-like family leading
+        priority = list(range(0xC0, 0xD0)) + list(range(0x40, 0x50)) + list(range(0x80, 0x90))
+        order = priority + [cmd for cmd in range(0x100) if cmd not in priority]
+        # All possible commands (0x00-0xFF), minus the known ones
+        return [cmd for cmd in order if cmd not in known_cmds]
+
+    def _responding(self) -> bool:
+        try:
+            status = self._read_interrupt()
+        except OSError:
+            return False
+        # Interrupt status bits are undocumented, but an all 0xFF reply
+        # means nobody drove SDA, i.e. the unit ACKed yet sent nothing
+        return status != b"\xff" * len(status)
+
+    def _recover(self) -> None:
+        try:
+            self.reset()
+            time.sleep(0.001)
+            # Reset clears the I2C setup, redo it like main() does
+            self.init()
+            self.stop()
+        except OSError as e:
+            # Keep sweeping, the next probe's check retries recovery
+            print("RF Unit reset failed:", e)
+
+    def _probe(self, cmd_buf: bytes) -> bytes:
+        """
+        Send one bruteforce probe, expect 0x10 bytes back.
+        Resets and re-inits the RF Unit if it stopped responding afterwards.
+        """
+        try:
+            res = self._transmit(cmd_buf, 0x10)
+        except OSError:
+            res = b""
+        if not self._responding():
+            print("RF Unit stopped responding, resetting")
+            self._recover()
+        return res
+
+    def bruteforce_cmd(self) -> int | None:
+        cmds_to_test = self._bruteforce_cmds()
+
+        # Assume address is packed as LE U32, read from addr 0
+        # Address stays the same for every probe, only the cmd byte changes
+        cmd_buf = bytearray(5)
+        _pack_addr_into(cmd_buf, 1, 0x0)
+        probe = self._probe
 
         for cmd in cmds_to_test:
             print(f"Current CMD: 0x{cmd:02X}")
-            cmd_buf = [cmd]
-            # Assume address is packed as LE U32, read from addr 0
-            addr_bytes = struct.pack("<I", 0x0)
-            # Append address to cmd
-            cmd_buf.extend(list(addr_bytes))
+            cmd_buf[0] = cmd
             # Send cmd and receive back data, expect 0x10 bytes
-            res = bytes(self.dev.transmit(cmd_buf, 0x10))
+            res = probe(cmd_buf)
             # Check if we have the identifier in returned bytes
             if POSSIBLE_DATA in res:
-                print(f"Possible match with payload {cmd_buf}")
+                print(f"Possible match with payload {bytes(cmd_buf)}")
                 print(f"Data: {res}")
                 return cmd
 
+    async def bruteforce_cmd_async(self, depth: int = 4) -> int | None:
+        """
+        Host-side variant of bruteforce_cmd.
+        Up to depth probes are queued on a single worker thread, bus access
+        stays serialized. Stops at the first match, probes queued behind it are
+        never sent to the RF Unit.
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+
+        import asyncio
+        import threading
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        cmds = iter(self._bruteforce_cmds())
+        # Set by the worker on a match, before it picks up the next queued probe
+        matched = threading.Event()
+
+        def probe(cmd_buf: bytes) -> bytes:
+            if matched.is_set():
+                return b""
+            res = self._probe(cmd_buf)
+            if POSSIBLE_DATA in res:
+                matched.set()
+            return res
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = deque()
+
+            def submit():
+                cmd = next(cmds, None)
+                if cmd is None:
+                    return
+                # Own buffer per probe, several are in flight at once
+                cmd_buf = bytearray(5)
+                cmd_buf[0] = cmd
+                # Assume address is packed as LE U32, read from addr 0
+                _pack_addr_into(cmd_buf, 1, 0x0)
+                pending.append((cmd_buf, loop.run_in_executor(executor, probe, cmd_buf)))
+
+            for _ in range(depth):
+                submit()
+
+            while pending:
+                cmd_buf, reply = pending.popleft()
+                print(f"Current CMD: 0x{cmd_buf[0]:02X}")
+                res = await reply
+                if POSSIBLE_DATA in res:
+                    for _, queued in pending:
+                        queued.cancel()
+                    print(f"Possible match with payload {bytes(cmd_buf)}")
+                    print(f"Data: {res}")
+                    return cmd_buf[0]
+                submit()
+
 class RegCONTROL:
     def __init__(self, val: int):
         self.val = val
-        self.INTEN = (val & (1 << 7)) != 0
-        self.I2CEN = (val & (1 << 6)) != 0
-        self.STA = (val & (1 << 5)) != 0
-        self.STO = (val & (1 << 4)) != 0
-        self.SI = (val & (1 << 3)) != 0
-        self.AA = (val & (1 << 2)) != 0
         # Reserved bits
-        assert (val & 2) == 0
-        assert (val & 1) == 0
-    
+        assert (val & 3) == 0
+
+    @property
+    def INTEN(self) -> bool:
+        return (self.val & (1 << 7)) != 0
+
+    @property
+    def I2CEN(self) -> bool:
+        return (self.val & (1 << 6)) != 0
+
+    @property
+    def STA(self) -> bool:
+        return (self.val & (1 << 5)) != 0
+
+    @property
+    def STO(self) -> bool:
+        return (self.val & (1 << 4)) != 0
+
+    @property
+    def SI(self) -> bool:
+        return (self.val & (1 << 3)) != 0
+
+    @property
+    def AA(self) -> bool:
+        return (self.val & (1 << 2)) != 0
+
     def __str__(self):
         return f"Status({self.val}) INTEN={self.INTEN} I2CEN={self.I2CEN} STA={self.STA} STO={self.STO} SI={self.SI} AA={self.AA}"
 
+class BlockWriter:
+    """
+    Collects chunks into a reusable block, writes it to f once full
+    """
+    def __init__(self, f, block_size: int = DUMP_BLOCK_SIZE):
+        self.write = f.write
+        self.block_size = block_size
+        self.mv = memoryview(bytearray(block_size))
+        self.pos = 0
+
+    def feed(self, chunk: bytes) -> None:
+        n = len(chunk)
+        if self.pos + n > self.block_size:
+            self.flush()
+            if n > self.block_size:
+                self.write(chunk)
+                return
+        self.mv[self.pos:self.pos + n] = chunk
+        self.pos += n
+
+    def flush(self) -> None:
+        if self.pos:
+            self.write(self.mv[:self.pos])
+            self.pos = 0
+
 class Devices:
     MICROPYTHON = "mpy"
     GREATFET = "greatfet"
     RPI = "rpi"
     DUMMY = "dummy"
 
-def main(name: str) -> int:
+def micropython_i2c(freq: int):
+    # Micropython
+    # Modify parameters depending on your pinout !
+    import machine
+    # Pi Pico - untested
+    # return machine.I2C(0, sda=machine.Pin(0), scl=machine.Pin(1), freq=freq)
+    # ESP8266
+    return machine.I2C(sda=machine.Pin(4), scl=machine.Pin(5), freq=freq)
+
+def main(name: str, probe_read_len: bool = False) -> int:
     if name == Devices.MICROPYTHON:
-        # Micropython
-        # Modify parameters depending on your pinout !
-        import machine
-        # Pi Pico - untested
-        # i2c_if = machine.I2C(0, sda=machine.Pin(0), scl=machine.Pin(1), freq=50000)
-        # ESP8266
-        i2c_if = machine.I2C(sda=machine.Pin(4), scl=machine.Pin(5), freq=50000)
-        device = MicropythonDevice(i2c_if)
+        device = MicropythonDevice(micropython_i2c(I2C_FREQ))
     elif name == Devices.GREATFET:
         device = GreatFetDevice()
     elif name == Devices.RPI:
@@ -309,18 +642,36 @@ def main(name: str) -> int:
 
     rfunit = RfUnitI2C(device)
 
-    if not rfunit.detect():
+    detected = rfunit.detect()
+    if not detected and name == Devices.MICROPYTHON:
+        print("Retrying detection at", I2C_FREQ_FALLBACK, "Hz")
+        rfunit = RfUnitI2C(MicropythonDevice(micropython_i2c(I2C_FREQ_FALLBACK)))
+        detected = rfunit.detect()
+
+    if not detected:
         print("RF Unit was not detected!")
         sys.exit(1)
 
     rfunit.init()
     rfunit.stop()
 
+    # Reads longer than FLASH_CHUNK_SIZE are undocumented, only probe on request
+    chunk_size = FLASH_CHUNK_SIZE
+    if probe_read_len:
+        chunk_size = rfunit.probe_read_length()
+        print("Flash read length:", chunk_size)
+
     print("Dumping flash")
-    with open("dump.bin", "wb") as f:
-        for chunk in rfunit.dump_flash(True):
+    with open("dump.bin", "wb", buffering=DUMP_FILE_BUFFERING) as f:
+        if name == Devices.MICROPYTHON:
             # For Micropython, you might want to print to UART instead..
-            f.write(chunk)
+            rfunit.dump_flash_to(f, True, chunk_size)
+        else:
+            # Host clients: prefetch the next reads while the current chunk is stored
+            import asyncio
+            writer = BlockWriter(f)
+            asyncio.run(rfunit.dump_flash_async(writer.feed, True, chunk_size))
+            writer.flush()
     print("File written")
 
     rfunit.play_sound(Sound.BING)